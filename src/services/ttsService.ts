@@ -1,4 +1,4 @@
-import { spawn } from 'child_process';
+import { ChildProcessWithoutNullStreams, spawn } from 'child_process';
 import path from 'path';
 
 // Queue system for TTS requests
@@ -53,36 +53,100 @@ async function processQueue() {
   }
 }
 
+// Persistent Python worker: one JSON request per stdin line, one JSON result per stdout line.
+// Spawning once avoids paying interpreter startup and a cold connection pool on every request.
+let worker: ChildProcessWithoutNullStreams | null = null;
+let pendingRequest: {
+  resolve: (value: Buffer) => void;
+  reject: (reason: Error) => void;
+} | null = null;
+let workerOutput = '';
+let workerError = '';
+
+function failPendingRequest(error: Error) {
+  const request = pendingRequest;
+  pendingRequest = null;
+  request?.reject(error);
+}
+
+function handleWorkerLine(line: string) {
+  const request = pendingRequest;
+  if (!request) {
+    return;
+  }
+  pendingRequest = null;
+
+  try {
+    const result = JSON.parse(line);
+    if (!result.success) {
+      return request.reject(new Error(result.error || 'TTS failed'));
+    }
+    const audioBuffer = Buffer.from(result.audio, 'base64');
+    request.resolve(audioBuffer);
+  } catch (e) {
+    request.reject(new Error('TTS parse error: ' + e + '\nOutput: ' + line));
+  }
+}
+
+function getWorker(): ChildProcessWithoutNullStreams {
+  // A worker that has exited or been killed may not have emitted 'close' yet
+  if (worker && (worker.exitCode !== null || worker.killed)) {
+    worker = null;
+    workerOutput = '';
+  }
+  if (worker) {
+    return worker;
+  }
+
+  const scriptPath = path.join(__dirname, '../utils/tts.py');
+  const py = spawn('python', [scriptPath, '--server']);
+
+  const onExit = (reason: string) => {
+    if (worker !== py) {
+      return;
+    }
+    // Next request respawns the worker
+    worker = null;
+    workerOutput = '';
+    py.kill();
+    failPendingRequest(new Error('TTS Python error: ' + (workerError || reason)));
+  };
+
+  // Output from a replaced worker must not settle requests sent to its successor
+  py.stdout.on('data', (data) => {
+    if (worker !== py) {
+      return;
+    }
+    workerOutput += data.toString();
+    let newline = workerOutput.indexOf('\n');
+    while (newline !== -1) {
+      const line = workerOutput.slice(0, newline);
+      workerOutput = workerOutput.slice(newline + 1);
+      handleWorkerLine(line);
+      newline = workerOutput.indexOf('\n');
+    }
+  });
+  py.stderr.on('data', (data) => {
+    if (worker !== py) {
+      return;
+    }
+    // Keep only the tail so progress logs from a long-lived worker don't grow unbounded
+    workerError = (workerError + data.toString()).slice(-4000);
+  });
+  py.stdin.on('error', (err) => onExit(err.message));
+  py.on('error', (err) => onExit(err.message));
+  py.on('close', (code) => onExit(`worker exited with code ${code}`));
+
+  worker = py;
+  return py;
+}
+
 async function processTTSRequest(text: string, voice: string): Promise<Buffer> {
   return new Promise((resolve, reject) => {
-    const scriptPath = path.join(__dirname, '../utils/tts.py');
-    const input = JSON.stringify({ text, voice });
-    const py = spawn('python', [scriptPath, input]);
-
-    let output = '';
-    let error = '';
-
-    py.stdout.on('data', (data) => {
-      output += data.toString();
-    });
-    py.stderr.on('data', (data) => {
-      error += data.toString();
-    });
-    py.on('close', (code) => {
-      if (code !== 0) {
-        return reject(new Error('TTS Python error: ' + error));
-      }
-      try {
-        const result = JSON.parse(output);
-        if (!result.success) {
-          return reject(new Error(result.error || 'TTS failed'));
-        }
-        const audioBuffer = Buffer.from(result.audio, 'base64');
-        resolve(audioBuffer);
-      } catch (e) {
-        reject(new Error('TTS parse error: ' + e + '\nOutput: ' + output));
-      }
-    });
+    const py = getWorker();
+    workerError = '';
+    pendingRequest = { resolve, reject };
+    py.stdin.write(JSON.stringify({ text, voice }) + '\n');
   });
 }
 
@@ -0,0 +1,127 @@
+import { EventEmitter } from 'events';
+import { describe, beforeEach, it, expect, jest } from '@jest/globals';
+
+// Fake Python worker: tests write to stdout/stderr and emit 'close' by hand
+class MockWorker extends EventEmitter {
+  stdout = new EventEmitter();
+  stderr = new EventEmitter();
+  stdin = Object.assign(new EventEmitter(), { write: jest.fn() });
+  exitCode: number | null = null;
+  killed = false;
+  kill = jest.fn(() => {
+    this.killed = true;
+    return true;
+  });
+}
+
+const mockWorkers: MockWorker[] = [];
+
+jest.mock('child_process', () => ({
+  spawn: jest.fn(() => {
+    const worker = new MockWorker();
+    mockWorkers.push(worker);
+    return worker;
+  }),
+}));
+
+let ttsService: typeof import('../services/ttsService');
+
+const flush = () => new Promise((resolve) => setTimeout(resolve, 0));
+
+const lastRequest = (worker: MockWorker) => {
+  const calls = worker.stdin.write.mock.calls;
+  return JSON.parse(String(calls[calls.length - 1][0]));
+};
+
+const resultLine = (audio: string) =>
+  JSON.stringify({ success: true, audio: Buffer.from(audio).toString('base64') }) + '\n';
+
+const reply = (worker: MockWorker, audio: string) =>
+  worker.stdout.emit('data', Buffer.from(resultLine(audio)));
+
+describe('TTS Service', () => {
+  beforeEach(async () => {
+    // Reload the service so each test starts without a worker
+    jest.resetModules();
+    mockWorkers.length = 0;
+    ttsService = await import('../services/ttsService');
+  });
+
+  it('should serve queued requests with a single worker', async () => {
+    const first = ttsService.generateSpeech({ text: 'first' });
+    const second = ttsService.generateSpeech({ text: 'second', voice: 'nova' });
+
+    expect(mockWorkers).toHaveLength(1);
+    const worker = mockWorkers[0];
+    expect(worker.stdin.write).toHaveBeenCalledTimes(1);
+    expect(lastRequest(worker)).toEqual({ text: 'first', voice: 'alloy' });
+
+    reply(worker, 'first-audio');
+    expect((await first).toString()).toBe('first-audio');
+
+    await flush();
+    expect(worker.stdin.write).toHaveBeenCalledTimes(2);
+    expect(lastRequest(worker)).toEqual({ text: 'second', voice: 'nova' });
+
+    reply(worker, 'second-audio');
+    expect((await second).toString()).toBe('second-audio');
+    expect(mockWorkers).toHaveLength(1);
+  });
+
+  it('should resolve a result split across multiple data events', async () => {
+    const speech = ttsService.generateSpeech({ text: 'hello' });
+    const worker = mockWorkers[0];
+
+    const line = resultLine('split-audio');
+    worker.stdout.emit('data', Buffer.from(line.slice(0, 10)));
+    await flush();
+    worker.stdout.emit('data', Buffer.from(line.slice(10)));
+
+    expect((await speech).toString()).toBe('split-audio');
+  });
+
+  it('should reject the pending request and respawn when the worker exits', async () => {
+    const failed = ttsService.generateSpeech({ text: 'crash' });
+    const worker = mockWorkers[0];
+
+    worker.stderr.emit('data', Buffer.from('Traceback: boom'));
+    worker.emit('close', 1);
+
+    await expect(failed).rejects.toThrow('TTS Python error: Traceback: boom');
+
+    await flush();
+    const retried = ttsService.generateSpeech({ text: 'again' });
+
+    expect(mockWorkers).toHaveLength(2);
+    const newWorker = mockWorkers[1];
+    expect(lastRequest(newWorker)).toEqual({ text: 'again', voice: 'alloy' });
+
+    reply(newWorker, 'again-audio');
+    expect((await retried).toString()).toBe('again-audio');
+  });
+
+  it('should use a new worker when the old one exits right after its last result', async () => {
+    const first = ttsService.generateSpeech({ text: 'first' });
+    const second = ttsService.generateSpeech({ text: 'second' });
+    const worker = mockWorkers[0];
+
+    // The worker writes its result and exits before 'close' is emitted
+    reply(worker, 'first-audio');
+    worker.exitCode = 0;
+    expect((await first).toString()).toBe('first-audio');
+
+    await flush();
+    expect(worker.stdin.write).toHaveBeenCalledTimes(1);
+    expect(mockWorkers).toHaveLength(2);
+    const newWorker = mockWorkers[1];
+    expect(lastRequest(newWorker)).toEqual({ text: 'second', voice: 'alloy' });
+
+    // Late output and 'close' from the old worker must not touch the new request
+    reply(worker, 'stale-audio');
+    worker.stderr.emit('data', Buffer.from('stale error'));
+    worker.emit('close', 0);
+
+    reply(newWorker, 'second-audio');
+    expect((await second).toString()).toBe('second-audio');
+  });
+});
@@ -1,14 +1,90 @@
 import sys
 import json
 import base64
+import hashlib
 import os
 import re
-import urllib.request
+import urllib.error
 import urllib.parse
+import http.client
 import io
 import time
+import random
 import socket
-from typing import Dict, Any, List
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, FrozenSet, Iterator, List, NamedTuple, Optional, Tuple
+
+try:
+    import redis
+except ImportError:  # Redis is optional, the in-memory cache is used without it
+    redis = None
+
+# Maximum number of concurrent TTS requests, overridable with TTS_MAX_WORKERS (1-8)
+try:
+    MAX_WORKERS = min(8, max(1, int(os.environ.get('TTS_MAX_WORKERS', 4))))
+except ValueError:
+    MAX_WORKERS = 4
+
+TTS_HOST = "translate.google.com"
+
+# An ID3 tag or an MPEG audio frame sync (MPEG-1/2/2.5 Layer III)
+MP3_SIGNATURES = (b'ID3', b'\xff\xfb', b'\xff\xf3', b'\xff\xf2')
+
+class RetryPolicy(NamedTuple):
+    """Which TTS request failures to retry, how often, and how long to wait in between"""
+    total: int = 3
+    backoff_factor: float = 0.5  # seconds, doubled on each attempt
+    backoff_max: float = 8
+    retry_after_max: float = 30
+    status_forcelist: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    
+    def is_retryable(self, error: Exception) -> bool:
+        if isinstance(error, urllib.error.HTTPError):
+            return error.code in self.status_forcelist
+        # Timeouts, dropped connections and invalid audio are worth another try
+        return isinstance(error, (http.client.HTTPException, OSError, ValueError))
+    
+    def delay(self, attempt: int, error: Exception) -> float:
+        """Exponential backoff with jitter, or the server's Retry-After when it sends one"""
+        if isinstance(error, urllib.error.HTTPError) and error.headers is not None:
+            retry_after = error.headers.get('Retry-After')
+            if retry_after and retry_after.isdigit():
+                return min(int(retry_after), self.retry_after_max)
+        return min(self.backoff_max, self.backoff_factor * (2 ** attempt)) + random.uniform(0, 0.25)
+
+RETRY_POLICY = RetryPolicy()
+
+# Headers sent with every TTS request to mimic a browser
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'audio/mpeg, audio/*, */*',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'identity',
+    'Connection': 'keep-alive'
+}
+
+# Sentence boundaries for both English and Nepali punctuation (। is the danda),
+# compiled once at import time instead of on every call
+SENTENCE_SPLIT_RE = re.compile(r'[.!?।]\s*')
+
+# Synthesized audio is deterministic for a given (text, lang), so it is cached
+AUDIO_CACHE_TTL = 86400 * 14  # 14 days
+AUDIO_CACHE_MAX_ENTRIES = 1024
+
+_mem_cache: "OrderedDict[str, bytes]" = OrderedDict()
+_mem_cache_lock = threading.Lock()
+_redis_client = None
+_redis_disabled = False
+
+# Shared by every text_to_speech call so worker threads, and their
+# connections, outlive a single request
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+# Each worker thread keeps its own keep-alive connection to TTS_HOST
+_local = threading.local()
 
 def detect_language(text: str) -> str:
     """Detect language from text"""
@@ -16,20 +92,25 @@ def detect_language(text: str) -> str:
         if not text or not isinstance(text, str):
             return 'en'
             
-        # Check for Nepali/Devanagari script
-        if re.search(r'[\u0900-\u097F]', text):
-            return 'hi'  # Use Hindi for Nepali text as it's supported
-        # Check for English
-        elif re.search(r'[a-zA-Z]', text):
-            return 'en'
-        else:
+        # Pure ASCII text can't contain Devanagari (isascii() is a flag check)
+        if text.isascii():
             return 'en'
+        
+        # Check for Nepali/Devanagari script: U+0900-U+097F encodes as E0 A4 xx or E0 A5 xx
+        encoded = text.encode('utf-8')
+        if b'\xe0\xa4' in encoded or b'\xe0\xa5' in encoded:
+            return 'hi'  # Use Hindi for Nepali text as it's supported
+        return 'en'
     except Exception as e:
         print(f"Error in language detection: {e}", file=sys.stderr)
         return 'en'  # Default to English on error
 
+def _truncate_utf8(text: str, max_bytes: int) -> str:
+    """Truncate text to at most max_bytes of UTF-8 without splitting a character"""
+    return text.encode('utf-8')[:max_bytes].decode('utf-8', 'ignore')
+
 def chunk_text(text: str, max_length: int = 200) -> List[str]:
-    """Split text into chunks that respect sentence boundaries"""
+    """Split text into chunks of at most max_length UTF-8 bytes that respect sentence boundaries"""
     try:
         if not text or not isinstance(text, str):
             return []
@@ -38,52 +119,55 @@ def chunk_text(text: str, max_length: int = 200) -> List[str]:
         if not text:
             return []
             
-        if len(text) <= max_length:
+        if len(text.encode('utf-8')) <= max_length:
             return [text]
         
         chunks = []
-        # Split by sentences first (support both English and Nepali punctuation)
-        sentences = re.split(r'[.!?।]\s*', text)
-        current_chunk = ""
+        # Build each chunk as a list of parts and join only when it is full,
+        # instead of growing a string one sentence at a time
+        buf: List[str] = []
+        buf_len = 0
         
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if not sentence:
-                continue
+        # Split by sentences first (support both English and Nepali punctuation),
+        # measuring each once in UTF-8 bytes since Devanagari takes 3 bytes per character
+        sentences = [
+            (sentence, len(sentence.encode('utf-8')))
+            for sentence in (s.strip() for s in SENTENCE_SPLIT_RE.split(text))
+            if sentence
+        ]
+        
+        for sentence, sentence_len in sentences:
+            # If single sentence is too long, split by words
+            if sentence_len <= max_length:
+                parts = [(sentence, sentence_len)]
+            else:
+                parts = [(word, len(word.encode('utf-8'))) for word in sentence.split()]
+            
+            for part, part_len in parts:
+                if part_len > max_length:
+                    # If single word is too long, truncate it
+                    part = _truncate_utf8(part, max_length)
+                    part_len = len(part.encode('utf-8'))
                 
-            # If adding this sentence would exceed limit, save current chunk
-            if len(current_chunk) + len(sentence) + 1 > max_length:
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-                    current_chunk = sentence
+                # Keep packing parts until the next one would overflow the chunk
+                need = part_len + (1 if buf else 0)
+                if buf_len + need > max_length:
+                    chunks.append(" ".join(buf))
+                    buf = [part]
+                    buf_len = part_len
                 else:
-                    # If single sentence is too long, split by words
-                    words = sentence.split()
-                    temp_chunk = ""
-                    for word in words:
-                        if len(temp_chunk) + len(word) + 1 > max_length:
-                            if temp_chunk:
-                                chunks.append(temp_chunk.strip())
-                                temp_chunk = word
-                            else:
-                                # If single word is too long, truncate it
-                                chunks.append(word[:max_length])
-                        else:
-                            temp_chunk += (" " + word) if temp_chunk else word
-                    if temp_chunk:
-                        current_chunk = temp_chunk
-            else:
-                current_chunk += (" " + sentence) if current_chunk else sentence
+                    buf.append(part)
+                    buf_len += need
         
-        if current_chunk:
-            chunks.append(current_chunk.strip())
+        if buf:
+            chunks.append(" ".join(buf))
         
         # Filter out empty chunks
         chunks = [chunk for chunk in chunks if chunk.strip()]
         
         # If no chunks were created, return the original text truncated
         if not chunks:
-            return [text[:max_length]]
+            return [_truncate_utf8(text, max_length)]
             
         return chunks
         
@@ -91,7 +175,7 @@ def chunk_text(text: str, max_length: int = 200) -> List[str]:
         print(f"Error in text chunking: {e}", file=sys.stderr)
         # Fallback: return original text truncated
         if text and isinstance(text, str):
-            return [text[:max_length]]
+            return [_truncate_utf8(text, max_length)]
         return []
 
 def validate_input(text: str) -> Dict[str, Any]:
@@ -106,11 +190,13 @@ def validate_input(text: str) -> Dict[str, Any]:
         if not text.strip():
             return {"success": False, "error": "Text cannot be empty or only whitespace"}
         
-        if len(text) > 5000:
+        n = len(text)
+        if n > 5000:
             return {"success": False, "error": "Text must be less than 5000 characters for TTS"}
         
-        # Check for potentially problematic characters
-        if len(text.encode('utf-8')) > 8000:  # UTF-8 byte length check
+        # Check for potentially problematic characters. At most 4 UTF-8 bytes per
+        # character, so only texts over 2000 characters need to be encoded to measure
+        if n > 2000 and len(text.encode('utf-8')) > 8000:  # UTF-8 byte length check
             return {"success": False, "error": "Text is too long when encoded (max 8000 bytes)"}
         
         return {"success": True}
@@ -118,85 +204,196 @@ def validate_input(text: str) -> Dict[str, Any]:
     except Exception as e:
         return {"success": False, "error": f"Input validation error: {str(e)}"}
 
-def make_tts_request(chunk: str, lang: str, retries: int = 3) -> bytes:
-    """Make a single TTS request with retry logic"""
-    for attempt in range(retries):
+def _get_connection() -> http.client.HTTPSConnection:
+    """Return this thread's persistent connection to the TTS host"""
+    conn = getattr(_local, 'conn', None)
+    if conn is None:
+        conn = http.client.HTTPSConnection(TTS_HOST, timeout=30)
+        _local.conn = conn
+    return conn
+
+def _close_connection() -> None:
+    """Drop this thread's connection so the next request opens a fresh one"""
+    conn = getattr(_local, 'conn', None)
+    if conn is not None:
+        conn.close()
+        _local.conn = None
+
+def _http_get(path: str) -> Tuple[http.client.HTTPResponse, bytes]:
+    """GET a path from the TTS host, reusing the connection when possible"""
+    conn = _get_connection()
+    reused = conn.sock is not None
+    try:
+        conn.request("GET", path, headers=DEFAULT_HEADERS)
+        response = conn.getresponse()
+        return response, response.read()
+    except (http.client.HTTPException, OSError) as e:
+        _close_connection()
+        # The server may have dropped an idle keep-alive connection, try once more on a new one
+        if reused and not isinstance(e, socket.timeout):
+            return _http_get(path)
+        raise
+
+def _cache_key(quoted_chunk: str, lang: str) -> str:
+    return f"gtts:v2:{hashlib.md5(quoted_chunk.encode('ascii')).hexdigest()}:{lang}"
+
+def _get_redis():
+    """Return the Redis client if REDIS_URL is configured and redis is installed"""
+    global _redis_client, _redis_disabled
+    if _redis_client is None and not _redis_disabled:
+        url = os.environ.get('REDIS_URL')
+        if redis is None or not url:
+            _redis_disabled = True
+        else:
+            _redis_client = redis.Redis.from_url(url, socket_timeout=2, socket_connect_timeout=2)
+    return _redis_client
+
+def _disable_redis(e: Exception) -> None:
+    """Fall back to the in-memory cache for the rest of this process"""
+    global _redis_disabled
+    if not _redis_disabled:
+        print(f"Redis unavailable, using in-memory audio cache: {e}", file=sys.stderr)
+    _redis_disabled = True
+
+def _cache_get(key: str) -> Optional[bytes]:
+    with _mem_cache_lock:
+        audio_bytes = _mem_cache.get(key)
+        if audio_bytes is not None:
+            _mem_cache.move_to_end(key)
+            return audio_bytes
+    
+    client = _get_redis()
+    if client is not None and not _redis_disabled:
         try:
-            # Google Translate TTS URL
-            tts_url = f"https://translate.google.com/translate_tts?ie=UTF-8&tl={lang}&client=tw-ob&q={urllib.parse.quote(chunk)}"
-            
-            # Set headers to mimic browser request
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Accept': 'audio/mpeg, audio/*, */*',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'identity',
-                'Connection': 'keep-alive'
-            }
-            
-            # Make request with timeout
-            req = urllib.request.Request(tts_url, headers=headers)
-            with urllib.request.urlopen(req, timeout=30) as response:
-                # Check response status
-                if response.status != 200:
-                    raise urllib.error.HTTPError(response.url, response.status, f"HTTP {response.status}", response.headers, None)
-                
-                audio_bytes = response.read()
-                
-                # Validate audio data
-                if len(audio_bytes) < 100:  # Too small, likely an error
-                    raise ValueError(f"Audio data too small ({len(audio_bytes)} bytes), likely an error response")
-                
-                # Check if it's actually audio data (MP3 files start with specific bytes)
-                if not (audio_bytes.startswith(b'\xff\xfb') or audio_bytes.startswith(b'ID3')):
-                    # Try to decode as text to see if it's an error message
-                    try:
-                        error_text = audio_bytes.decode('utf-8')
-                        raise ValueError(f"Received text instead of audio: {error_text[:100]}...")
-                    except UnicodeDecodeError:
-                        pass  # It's binary data, might be audio
-                
-                return audio_bytes
-                
-        except socket.timeout:
-            if attempt < retries - 1:
-                print(f"Timeout on attempt {attempt + 1}, retrying...", file=sys.stderr)
-                time.sleep(1)
-                continue
-            raise ValueError(f"Request timeout after {retries} attempts")
-            
-        except urllib.error.HTTPError as e:
-            if e.code == 429:  # Rate limiting
-                if attempt < retries - 1:
-                    wait_time = (attempt + 1) * 2
-                    print(f"Rate limited, waiting {wait_time}s before retry...", file=sys.stderr)
-                    time.sleep(wait_time)
-                    continue
-                raise ValueError(f"Rate limited after {retries} attempts")
-            elif e.code >= 500:  # Server errors
-                if attempt < retries - 1:
-                    print(f"Server error {e.code}, retrying...", file=sys.stderr)
-                    time.sleep(1)
-                    continue
-                raise ValueError(f"Server error {e.code}: {e.reason}")
-            else:
-                raise ValueError(f"HTTP error {e.code}: {e.reason}")
-                
-        except urllib.error.URLError as e:
-            if attempt < retries - 1:
-                print(f"Network error on attempt {attempt + 1}, retrying...", file=sys.stderr)
-                time.sleep(1)
-                continue
-            raise ValueError(f"Network error after {retries} attempts: {e.reason}")
-            
+            audio_bytes = client.get(key)
         except Exception as e:
-            if attempt < retries - 1:
-                print(f"Unexpected error on attempt {attempt + 1}: {e}, retrying...", file=sys.stderr)
-                time.sleep(1)
-                continue
-            raise ValueError(f"Request failed after {retries} attempts: {str(e)}")
+            _disable_redis(e)
+            return None
+        if audio_bytes is not None:
+            _cache_set(key, audio_bytes, remote=False)
+        return audio_bytes
+    return None
+
+def _cache_set(key: str, audio_bytes: bytes, remote: bool = True) -> None:
+    with _mem_cache_lock:
+        _mem_cache[key] = audio_bytes
+        _mem_cache.move_to_end(key)
+        while len(_mem_cache) > AUDIO_CACHE_MAX_ENTRIES:
+            _mem_cache.popitem(last=False)
+    
+    client = _get_redis() if remote else None
+    if client is not None and not _redis_disabled:
+        try:
+            client.set(key, audio_bytes, ex=AUDIO_CACHE_TTL)
+        except Exception as e:
+            _disable_redis(e)
+
+def quote_chunk(chunk: str) -> str:
+    """URL-encode a chunk for the TTS query string"""
+    # quote_from_bytes skips quote()'s per-call str handling and encodes the UTF-8 bytes directly
+    return urllib.parse.quote_from_bytes(chunk.encode('utf-8'), safe='')
+
+def make_tts_request(quoted_chunk: str, lang: str, policy: RetryPolicy = RETRY_POLICY) -> bytes:
+    """Return audio for a single URL-encoded chunk, from the cache when available"""
+    key = _cache_key(quoted_chunk, lang)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+    
+    audio_bytes = _request_tts_audio(quoted_chunk, lang, policy)
+    _cache_set(key, audio_bytes)
+    return audio_bytes
+
+def _fetch_tts_audio(quoted_chunk: str, lang: str) -> bytes:
+    """Make a single TTS request and validate the returned audio"""
+    # Google Translate TTS path on TTS_HOST
+    tts_path = f"/translate_tts?ie=UTF-8&tl={lang}&client=tw-ob&q={quoted_chunk}"
+    
+    response, audio_bytes = _http_get(tts_path)
+    
+    # Check response status
+    if response.status != 200:
+        raise urllib.error.HTTPError(f"https://{TTS_HOST}{tts_path}", response.status, f"HTTP {response.status}", response.headers, None)
+    
+    # Validate audio data
+    if len(audio_bytes) < 100:  # Too small, likely an error
+        raise ValueError(f"Audio data too small ({len(audio_bytes)} bytes), likely an error response")
+    
+    # Check if it's actually audio data (MP3 files start with specific bytes)
+    if not audio_bytes.startswith(MP3_SIGNATURES):
+        # Try to decode as text to see if it's an error message
+        try:
+            error_text = audio_bytes.decode('utf-8')
+            raise ValueError(f"Received text instead of audio: {error_text[:100]}...")
+        except UnicodeDecodeError:
+            pass  # It's binary data, might be audio
+    
+    return audio_bytes
+
+def _with_retries(fn: Callable[[], bytes], policy: RetryPolicy = RETRY_POLICY) -> bytes:
+    """Call fn, retrying failures the policy allows and re-raising the last error"""
+    for attempt in range(policy.total):
+        try:
+            return fn()
+        except Exception as e:
+            if attempt == policy.total - 1 or not policy.is_retryable(e):
+                raise
+            delay = policy.delay(attempt, e)
+            print(f"Attempt {attempt + 1} failed ({e}), retrying in {delay:.2f}s...", file=sys.stderr)
+            time.sleep(delay)
     
     raise ValueError("All retries exhausted")
+
+def _request_tts_audio(quoted_chunk: str, lang: str, policy: RetryPolicy = RETRY_POLICY) -> bytes:
+    """Make a TTS request with retry logic"""
+    try:
+        return _with_retries(lambda: _fetch_tts_audio(quoted_chunk, lang), policy)
+    except urllib.error.HTTPError as e:
+        if e.code == 429:
+            raise ValueError(f"Rate limited after {policy.total} attempts") from e
+        if e.code >= 500:
+            raise ValueError(f"Server error {e.code}: {e.reason}") from e
+        raise ValueError(f"HTTP error {e.code}: {e.reason}") from e
+    except socket.timeout as e:
+        raise ValueError(f"Request timeout after {policy.total} attempts") from e
+    except (http.client.HTTPException, OSError) as e:
+        raise ValueError(f"Network error after {policy.total} attempts: {e}") from e
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the shared pool that runs TTS requests"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="tts")
+        return _executor
+
+def _iter_audio(chunks: List[str], lang: str) -> Iterator[Tuple[int, Optional[bytes], Optional[Exception]]]:
+    """Yield (index, audio, error) for each chunk in order, keeping the following requests in flight"""
+    pool = _get_executor()
+    # URL-encode every chunk up front so workers only do socket I/O
+    quoted_chunks = [quote_chunk(chunk) for chunk in chunks]
+    pending = deque()
+    next_index = 0
+    try:
+        while next_index < len(chunks) or pending:
+            # Keep up to MAX_WORKERS requests ahead of the chunk being consumed
+            while next_index < len(chunks) and len(pending) < MAX_WORKERS:
+                pending.append(pool.submit(make_tts_request, quoted_chunks[next_index], lang))
+                next_index += 1
+            
+            i = next_index - len(pending)
+            print(f"Processing chunk {i+1}/{len(chunks)}: {chunks[i][:50]}...", file=sys.stderr)
+            future = pending.popleft()
+            try:
+                result = (i, future.result(), None)
+            except Exception as e:
+                result = (i, None, e)
+            yield result
+    finally:
+        # Consumer stopped early, don't start requests nobody will read
+        for future in pending:
+            future.cancel()
+
 def text_to_speech(text: str, voice: str = "alloy") -> Dict[str, Any]:
     """Convert text to speech using free Google Translate TTS with comprehensive error handling"""
     try:
@@ -211,7 +408,7 @@ def text_to_speech(text: str, voice: str = "alloy") -> Dict[str, Any]:
             return {"success": False, "error": "Could not detect language"}
         
         # Split text into manageable chunks
-        chunks = chunk_text(text.strip(), 190)  # Leave some buffer
+        chunks = chunk_text(text.strip(), 200)  # Max UTF-8 bytes per request
         if not chunks:
             return {"success": False, "error": "Could not process text into chunks"}
         
@@ -220,30 +417,22 @@ def text_to_speech(text: str, voice: str = "alloy") -> Dict[str, Any]:
         
         print(f"Processing {len(chunks)} chunks in language: {lang}", file=sys.stderr)
         
-        for i, chunk in enumerate(chunks):
-            try:
-                print(f"Processing chunk {i+1}/{len(chunks)}: {chunk[:50]}...", file=sys.stderr)
-                
-                # Make TTS request with retries
-                audio_bytes = make_tts_request(chunk, lang)
+        for i, audio_bytes, error in _iter_audio(chunks, lang):
+            if error is None:
                 audio_parts.append(audio_bytes)
+                continue
                 
-                # Add small delay between requests to avoid rate limiting
-                if i < len(chunks) - 1:
-                    time.sleep(0.5)
-                    
-            except Exception as e:
-                error_msg = f"Failed to process chunk {i+1}: {str(e)}"
-                print(error_msg, file=sys.stderr)
-                failed_chunks.append({"chunk": i+1, "text": chunk[:50], "error": str(e)})
-                
-                # If too many chunks fail, abort
-                if len(failed_chunks) > len(chunks) // 2:
-                    return {
-                        "success": False, 
-                        "error": f"Too many chunks failed ({len(failed_chunks)}/{len(chunks)})",
-                        "failed_chunks": failed_chunks
-                    }
+            error_msg = f"Failed to process chunk {i+1}: {str(error)}"
+            print(error_msg, file=sys.stderr)
+            failed_chunks.append({"chunk": i+1, "text": chunks[i][:50], "error": str(error)})
+            
+            # If too many chunks fail, abort
+            if len(failed_chunks) > len(chunks) // 2:
+                return {
+                    "success": False, 
+                    "error": f"Too many chunks failed ({len(failed_chunks)}/{len(chunks)})",
+                    "failed_chunks": failed_chunks
+                }
         
         # Check if we have any audio parts
         if not audio_parts:
@@ -256,13 +445,15 @@ def text_to_speech(text: str, voice: str = "alloy") -> Dict[str, Any]:
         # Combine all audio parts
         try:
             combined_audio = b''.join(audio_parts)
+            audio_size = len(combined_audio)
             
             # Validate combined audio
-            if len(combined_audio) < 100:
+            if audio_size < 100:
                 return {"success": False, "error": "Combined audio is too small to be valid"}
             
-            # Convert bytes to base64 for JSON serialization
-            audio_base64 = base64.b64encode(combined_audio).decode('utf-8')
+            # Convert bytes to base64 for JSON serialization (base64 output is pure ASCII)
+            audio_base64 = base64.b64encode(combined_audio).decode('ascii')
+            del combined_audio
             
             result = {"success": True, "audio": audio_base64}
             
@@ -271,7 +462,7 @@ def text_to_speech(text: str, voice: str = "alloy") -> Dict[str, Any]:
                 result["warnings"] = f"{len(failed_chunks)} chunks failed but audio was still generated"
                 result["failed_chunks"] = failed_chunks
             
-            print(f"Successfully generated {len(combined_audio)} bytes of audio", file=sys.stderr)
+            print(f"Successfully generated {audio_size} bytes of audio", file=sys.stderr)
             return result
             
         except Exception as e:
@@ -286,51 +477,80 @@ def text_to_speech(text: str, voice: str = "alloy") -> Dict[str, Any]:
         print(error_msg, file=sys.stderr)
         return {"success": False, "error": error_msg}
 
+def write_result(result: Dict[str, Any]) -> None:
+    """Write a result as one JSON line of bytes straight to stdout"""
+    # ensure_ascii (the default) makes the output pure ASCII, so encoding is a plain copy
+    data = json.dumps(result, separators=(',', ':')).encode('ascii')
+    sys.stdout.buffer.writelines((data, b'\n'))
+    sys.stdout.buffer.flush()
+
+def handle_request(input_data: Any) -> Tuple[Dict[str, Any], bool]:
+    """Run a TTS request from decoded JSON input, returning (result, input_valid)"""
+    if not isinstance(input_data, dict) or not input_data.get("text"):
+        return {"success": False, "error": "Missing 'text' parameter in input"}, False
+    
+    voice = input_data.get("voice", "alloy")
+    if not isinstance(voice, str):
+        voice = "alloy"  # Default fallback
+    
+    return text_to_speech(input_data["text"], voice), True
+
+def serve() -> None:
+    """Answer one JSON request per stdin line with one JSON result line on stdout"""
+    # A long-lived worker pays interpreter startup once and keeps the
+    # worker pool, connections and audio cache warm between requests
+    for line in iter(sys.stdin.buffer.readline, b''):
+        if not line.strip():
+            continue
+        try:
+            result, _ = handle_request(json.loads(line))
+        except json.JSONDecodeError as e:
+            result = {"success": False, "error": f"Invalid JSON input: {str(e)}"}
+        except Exception as e:
+            error_msg = f"Unexpected error: {str(e)}"
+            print(f"Critical error: {error_msg}", file=sys.stderr)
+            result = {"success": False, "error": error_msg}
+        write_result(result)
+
 if __name__ == "__main__":
     try:
+        if "--server" in sys.argv[1:]:
+            serve()
         # Read input from command line arguments
-        if len(sys.argv) > 1:
+        elif len(sys.argv) > 1:
             try:
                 input_data = json.loads(sys.argv[1])
             except json.JSONDecodeError as e:
-                print(json.dumps({"success": False, "error": f"Invalid JSON input: {str(e)}"}))
+                write_result({"success": False, "error": f"Invalid JSON input: {str(e)}"})
                 sys.exit(1)
             
-            # Extract and validate parameters
-            text = input_data.get("text")
-            voice = input_data.get("voice", "alloy")
-            
-            if not text:
-                print(json.dumps({"success": False, "error": "Missing 'text' parameter in input"}))
-                sys.exit(1)
-            
-            if not isinstance(voice, str):
-                voice = "alloy"  # Default fallback
-            
             # Process TTS request
-            result = text_to_speech(text, voice)
+            result, input_valid = handle_request(input_data)
+            if not input_valid:
+                write_result(result)
+                sys.exit(1)
             
             # Output result
             try:
-                print(json.dumps(result))
+                write_result(result)
             except Exception as e:
                 # Fallback in case of JSON serialization error
                 error_result = {"success": False, "error": f"Failed to serialize result: {str(e)}"}
-                print(json.dumps(error_result))
+                write_result(error_result)
                 sys.exit(1)
                 
         else:
-            print(json.dumps({"success": False, "error": "No input provided. Usage: python tts.py '{\"text\": \"your text\", \"voice\": \"alloy\"}'"}))
+            write_result({"success": False, "error": "No input provided. Usage: python tts.py '{\"text\": \"your text\", \"voice\": \"alloy\"}' or python tts.py --server"})
             sys.exit(1)
             
     except KeyboardInterrupt:
-        print(json.dumps({"success": False, "error": "Operation cancelled by user"}))
+        write_result({"success": False, "error": "Operation cancelled by user"})
         sys.exit(1)
     except MemoryError:
-        print(json.dumps({"success": False, "error": "Insufficient memory to complete operation"}))
+        write_result({"success": False, "error": "Insufficient memory to complete operation"})
         sys.exit(1)
     except Exception as e:
         error_msg = f"Unexpected error: {str(e)}"
         print(f"Critical error: {error_msg}", file=sys.stderr)
-        print(json.dumps({"success": False, "error": error_msg}))
+        write_result({"success": False, "error": error_msg})
         sys.exit(1) 
\ No newline at end of file